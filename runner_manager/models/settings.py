@@ -1,27 +1,57 @@
+import copy
+import os
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
 import yaml
 from githubkit import AppInstallationAuthStrategy, TokenAuthStrategy
-from pydantic import AnyHttpUrl, BaseSettings, ConfigError, Field, RedisDsn, SecretStr
+from pydantic import (
+    AnyHttpUrl,
+    BaseSettings,
+    ConfigError,
+    Field,
+    RedisDsn,
+    SecretStr,
+    validator,
+)
 
 from runner_manager.models.runner_group import BaseRunnerGroup
 
+# Prefer the libyaml-backed loader when available, it is much faster
+# than the pure-python implementation.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class ConfigFile(BaseSettings):
-    config_file: Optional[Path] = None
+# Resolved once per process to avoid looking up the dotenv file
+# on every Settings instantiation.
+_ENV_FILE: Optional[str] = ".env" if Path(".env").is_file() else None
+
+
+@lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse a yaml file, cached by path and modification time
+    so that an unchanged file is only parsed once.
+    """
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
 
 
 def yaml_config_settings_source(settings: BaseSettings) -> Dict[str, Any]:
     """
     A simple settings source that loads variables from a yaml file
 
+    The path of the file is read from the CONFIG_FILE environment variable.
+
     """
 
-    config = ConfigFile()
-    if config.config_file is not None:
-        return yaml.full_load(config.config_file.read_text())
+    config_file = os.environ.get("CONFIG_FILE")
+    if config_file:
+        path = Path(config_file)
+        mtime = path.stat().st_mtime
+        # Return a copy so that the cached value is never mutated
+        return copy.deepcopy(_load_yaml(str(path), mtime))
     return {}
 
 
@@ -44,6 +74,28 @@ class Settings(BaseSettings):
     github_client_id: Optional[str] = None
     github_client_secret: SecretStr = SecretStr("")
 
+    @validator(
+        "timeout_runner",
+        "time_to_live",
+        "healthcheck_interval",
+        "indexing_interval",
+        pre=True,
+    )
+    def parse_seconds(cls, v: Any) -> Any:
+        """
+        Convert durations given as a number of seconds to timedelta.
+
+        Other values are left to pydantic's duration parsing.
+        """
+        try:
+            if isinstance(v, (int, float)) and not isinstance(v, bool):
+                return timedelta(seconds=v)
+            if isinstance(v, str) and v.isdecimal():
+                return timedelta(seconds=int(v))
+        except OverflowError as exp:
+            raise ValueError(f"duration {v} is out of range") from exp
+        return v
+
     @property
     def app_install(self) -> bool:
         """
@@ -55,13 +107,11 @@ class Settings(BaseSettings):
         - github_private_key
         - github_installation_id
         """
-        if (
+        return bool(
             self.github_app_id
             and self.github_private_key
             and self.github_installation_id
-        ):
-            return True
-        return False
+        )
 
     def github_auth_strategy(self) -> AppInstallationAuthStrategy | TokenAuthStrategy:
         """
@@ -83,7 +133,7 @@ class Settings(BaseSettings):
 
     class Config:
         smart_union = True
-        env_file = ".env"
+        env_file = _ENV_FILE
         env_file_encoding = "utf-8"
 
         @classmethod
@@ -93,9 +143,8 @@ class Settings(BaseSettings):
             env_settings,
             file_secret_settings,
         ):
-            return (
-                init_settings,
-                yaml_config_settings_source,
-                env_settings,
-                file_secret_settings,
-            )
+            sources = [init_settings, yaml_config_settings_source, env_settings]
+            # The secrets source is a no-op unless a secrets_dir is configured
+            if file_secret_settings.secrets_dir is not None:
+                sources.append(file_secret_settings)
+            return tuple(sources)
@@ -1,9 +1,38 @@
+import os
+
 from pytest import fixture
 
 from runner_manager.backend.base import BaseBackend
+from runner_manager.backend.gcloud import GCPBackend
+from runner_manager.models.backend import GCPConfig, GCPInstanceConfig
 
 
 @fixture()
 def backend(runner_group) -> BaseBackend:
     """Fixture for backend."""
     return runner_group.backend
+
+
+@fixture(scope="session")
+def gcp_config() -> GCPConfig:
+    """GCP backend configuration built once from the environment."""
+    return GCPConfig(
+        project_id=os.environ.get("CLOUDSDK_CORE_PROJECT", ""),
+        region=os.environ.get("CLOUDSDK_COMPUTE_REGION", ""),
+        zone=os.environ.get("CLOUDSDK_COMPUTE_ZONE", ""),
+        google_application_credentials=os.environ.get(
+            "GOOGLE_APPLICATION_CREDENTIALS", ""
+        ),
+    )
+
+
+@fixture(scope="module")
+def gcp_backend() -> GCPBackend:
+    """GCP backend shared by tests that do not call the GCP API."""
+    return GCPBackend(
+        config=GCPConfig(
+            zone="europe-west1-a",
+            project_id="project",
+        ),
+        instance_config=GCPInstanceConfig(),
+    )
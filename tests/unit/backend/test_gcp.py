@@ -1,10 +1,11 @@
 import os
-from typing import List
+from typing import Generator, List
+from uuid import uuid4
 
 from githubkit.webhooks.types import WorkflowJobEvent
 from google.cloud.compute import Image, NetworkInterface
 from hypothesis import given
-from pytest import fixture, mark, raises
+from pytest import MonkeyPatch, fixture, mark, raises
 from redis_om import NotFoundError
 
 from runner_manager.backend.gcloud import GCPBackend
@@ -15,24 +16,18 @@ from runner_manager.models.runner_group import RunnerGroup
 from ...strategies import WorkflowJobInProgressStrategy
 
 
-@fixture()
-def gcp_group(settings, monkeypatch) -> RunnerGroup:
-    config = GCPConfig(
-        project_id=os.environ.get("CLOUDSDK_CORE_PROJECT", ""),
-        region=os.environ.get("CLOUDSDK_COMPUTE_REGION", ""),
-        zone=os.environ.get("CLOUDSDK_COMPUTE_ZONE", ""),
-        google_application_credentials=os.environ.get(
-            "GOOGLE_APPLICATION_CREDENTIALS", ""
-        ),
-    )
+@fixture(scope="module")
+def gcp_group(gcp_config: GCPConfig) -> Generator[RunnerGroup, None, None]:
+    # The group is shared by every test of the module, so it can not rely
+    # on the function scoped settings fixture for the manager name.
     runner_group: RunnerGroup = RunnerGroup(
         id=2,
         name="test",
         organization="octo-org",
-        manager=settings.name,
+        manager=uuid4().hex,
         backend=GCPBackend(
             name=Backends.gcloud,
-            config=config,
+            config=gcp_config,
             instance_config=GCPInstanceConfig(
                 labels={
                     "key": "value",
@@ -48,24 +43,27 @@ def gcp_group(settings, monkeypatch) -> RunnerGroup:
         source_image="my_image",
     )
 
-    monkeypatch.setattr(GCPBackend, "image", fake_image)
-    return runner_group
+    with MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(GCPBackend, "image", fake_image)
+        yield runner_group
 
 
 @fixture()
 def gcp_runner(runner: Runner, gcp_group: RunnerGroup) -> Runner:
     # Cleanup and return a runner for testing
+    # The group is module scoped, align the runner on its manager
+    runner.manager = gcp_group.manager
     gcp_group.backend.delete(runner)
     return runner
 
 
-def test_gcp_network_interfaces(gcp_group: RunnerGroup):
+def test_gcp_network_interfaces(gcp_group: RunnerGroup, monkeypatch):
     interfaces: List[NetworkInterface] = gcp_group.backend.network_interfaces
     assert len(interfaces) == 1
     assert "default" in gcp_group.backend.network_interfaces[0].subnetwork
     assert interfaces[0].access_configs[0].name == "External NAT"
     # Test disabling external IP
-    gcp_group.backend.instance_config.enable_external_ip = False
+    monkeypatch.setattr(gcp_group.backend.instance_config, "enable_external_ip", False)
     interfaces: List[NetworkInterface] = gcp_group.backend.network_interfaces
     assert len(interfaces) == 1
     assert len(interfaces[0].access_configs) == 0
@@ -100,7 +98,9 @@ def test_gcp_setup_labels(runner: Runner, gcp_group: RunnerGroup):
 
 
 @given(webhook=WorkflowJobInProgressStrategy)
-def test_gcp_setup_labels_with_webhook(webhook: WorkflowJobEvent):
+def test_gcp_setup_labels_with_webhook(
+    gcp_backend: GCPBackend, webhook: WorkflowJobEvent
+):
     runner: Runner = Runner(
         name=webhook.workflow_job.runner_name,
         id=webhook.workflow_job.runner_id,
@@ -109,28 +109,21 @@ def test_gcp_setup_labels_with_webhook(webhook: WorkflowJobEvent):
         runner_group_id=webhook.workflow_job.runner_group_id,
         status="online",
     )
-    backend = GCPBackend(
-        config=GCPConfig(
-            zone="europe-west1-a",
-            project_id="project",
-        ),
-        instance_config=GCPInstanceConfig(),
-    )
-    labels = backend.setup_labels(runner, webhook)
+    labels = gcp_backend.setup_labels(runner, webhook)
     assert "workflow" in labels.keys()
     assert "repository" in labels.keys()
 
     # Test with no webhook
-    labels = backend.setup_labels(runner)
+    labels = gcp_backend.setup_labels(runner)
     assert "workflow" not in labels.keys()
 
 
-def test_gcp_spot_config(runner: Runner, gcp_group: RunnerGroup):
-    gcp_group.backend.instance_config.spot = True
+def test_gcp_spot_config(runner: Runner, gcp_group: RunnerGroup, monkeypatch):
+    monkeypatch.setattr(gcp_group.backend.instance_config, "spot", True)
     scheduling = gcp_group.backend.scheduling
     assert scheduling.provisioning_model == "SPOT"
     assert scheduling.instance_termination_action == "DELETE"
-    gcp_group.backend.instance_config.spot = False
+    monkeypatch.setattr(gcp_group.backend.instance_config, "spot", False)
     scheduling = gcp_group.backend.scheduling
     assert scheduling.provisioning_model == "STANDARD"
     assert scheduling.instance_termination_action == "DEFAULT"
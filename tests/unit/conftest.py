@@ -1,3 +1,4 @@
+import os
 from base64 import b64encode
 from datetime import datetime, timedelta, timezone
 
@@ -14,7 +15,14 @@ hypothesis_settings.register_profile(
     max_examples=10,
     deadline=timedelta(seconds=1),
 )
-hypothesis_settings.load_profile("unit")
+# Same example budget as the unit profile, without the per-example deadline
+# that is prone to flakiness on shared CI runners.
+hypothesis_settings.register_profile(
+    "ci",
+    parent=hypothesis_settings.get_profile("unit"),
+    deadline=None,
+)
+hypothesis_settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "unit"))
 
 
 @fixture()
@@ -1,17 +1,19 @@
 import os
 import tempfile
+from datetime import timedelta
+from pathlib import Path
 
 import pytest
 import yaml
 from githubkit import AppInstallationAuthStrategy, TokenAuthStrategy
 from hypothesis import assume, given
 from hypothesis import strategies as st
-from pydantic import ConfigError
+from pydantic import ConfigError, SecretStr, ValidationError
 from pytest import fixture
 
 from runner_manager.dependencies import get_settings
 from runner_manager.models.runner_group import RunnerGroup
-from runner_manager.models.settings import ConfigFile, Settings
+from runner_manager.models.settings import Settings
 
 
 @fixture
@@ -41,8 +43,7 @@ def config_file(yaml_data, monkeypatch):
     with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
         yaml.dump(yaml_data, f)
         monkeypatch.setenv("CONFIG_FILE", f.name)
-        config = ConfigFile()
-        return config.config_file
+        return Path(f.name)
 
 
 def test_settings_default_values():
@@ -69,6 +70,18 @@ def test_yaml_config(config_file, yaml_data):
     assert settings.github_base_url == yaml_data["github_base_url"]
 
 
+def test_yaml_config_cache(config_file, yaml_data):
+    settings = Settings()
+    assert settings.name == yaml_data["name"]
+    # Updating the file must invalidate the cached content
+    yaml_data["name"] = "updated-runner-manager"
+    with open(config_file, "w") as f:
+        yaml.dump(yaml_data, f)
+    os.utime(config_file, (0, os.stat(config_file).st_mtime + 1))
+    settings = Settings()
+    assert settings.name == yaml_data["name"]
+
+
 def test_redhat_credentials(config_file, monkeypatch):
     monkeypatch.setenv("REDHAT_USERNAME", "username")
     monkeypatch.setenv("REDHAT_PASSWORD", "password")
@@ -101,6 +114,19 @@ def test_get_settings(config_file):
         Settings()
 
 
+def test_get_settings_invalid_runner_group(monkeypatch):
+    with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+        yaml.dump({"runner_groups": [{"name": 1}]}, f)
+    monkeypatch.setenv("CONFIG_FILE", f.name)
+    get_settings.cache_clear()
+    try:
+        with pytest.raises(ValidationError):
+            get_settings()
+    finally:
+        get_settings.cache_clear()
+        os.remove(f.name)
+
+
 @given(
     st.builds(
         Settings,
@@ -145,6 +171,41 @@ def test_config_error(stsettings):
         stsettings.github_auth_strategy()
 
 
+def test_settings_durations():
+    settings = Settings(
+        timeout_runner=60,
+        time_to_live="3600",
+        healthcheck_interval=1.5,
+        indexing_interval="PT1H",
+    )
+    assert settings.timeout_runner == timedelta(seconds=60)
+    assert settings.time_to_live == timedelta(hours=1)
+    assert settings.healthcheck_interval == timedelta(seconds=1.5)
+    assert settings.indexing_interval == timedelta(hours=1)
+    assert Settings(time_to_live=None).time_to_live is None
+    with pytest.raises(ValidationError):
+        Settings(timeout_runner=float("inf"))
+    with pytest.raises(ValidationError):
+        Settings(time_to_live=str(10**20))
+
+
+def test_github_auth_strategy_copy():
+    settings = Settings(github_token="a")
+    assert settings.github_auth_strategy().token == "a"
+    updated = settings.copy(update={"github_token": SecretStr("b")})
+    assert updated.github_auth_strategy().token == "b"
+
+
+def test_app_install_follows_fields():
+    settings = Settings(
+        github_app_id=1, github_installation_id=1, github_private_key="key"
+    )
+    assert settings.app_install is True
+    assert settings.copy(update={"github_installation_id": 0}).app_install is False
+    settings.github_app_id = 0
+    assert settings.app_install is False
+
+
 def test_settings_runner_group(runner_group: RunnerGroup):
     settings = Settings(runner_groups=[runner_group])
     assert settings.runner_groups == [runner_group]